@@ -7,7 +7,7 @@ from typing import Optional
 # Ensure we can import from src if running from the python directory
 sys.path.append(os.path.abspath("src"))
 
-from scopedb import Client
+from scopedb import Client, new_event_loop
 
 async def run_test(url: str, token: Optional[str] = None):
     print(f"Connecting to {url}...")
@@ -50,4 +50,4 @@ if __name__ == "__main__":
     parser.add_argument("--token", help="ScopeDB auth token", default=os.getenv("SCOPEDB_TOKEN"))
 
     args = parser.parse_args()
-    asyncio.run(run_test(args.url, args.token))
+    asyncio.run(run_test(args.url, args.token), loop_factory=new_event_loop)
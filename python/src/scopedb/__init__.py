@@ -1,6 +1,7 @@
 from .client import Client
 from .cable import RawCable
 from .errors import ScopeDBError, ConnectionError, QueryError
+from .loop import new_event_loop
 from .models import (
     ResultFormat,
     StatementStatus,
@@ -27,4 +28,5 @@ __all__ = [
     "ResultSet",
     "Statement",
     "StatementHandle",
+    "new_event_loop",
 ]
\ No newline at end of file
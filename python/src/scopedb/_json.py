@@ -0,0 +1,75 @@
+import dataclasses
+import json
+import math
+from datetime import date, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+# Both encoders accept the same values and encode them the same way, so that
+# installing orjson never changes which rows a cable accepts. Besides JSON
+# types, that is datetime, date, time, UUID, Enum and dataclass values;
+# keys may also be int, float, bool or None, and NaN and infinity become null.
+
+
+def _default(obj: Any) -> Any:
+    # The types orjson encodes natively, in the same representation.
+    if isinstance(obj, (date, time)):  # datetime is a subclass of date
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _finite(obj: Any) -> Any:
+    # Replaces NaN and infinity with None, as orjson encodes them as null.
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _finite(_default(obj))
+    return obj
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    try:
+        s = json.dumps(
+            obj, separators=(",", ":"), default=_default, allow_nan=False
+        )
+    except ValueError:
+        # Raised for NaN and infinity; retry on the rare rows holding them.
+        s = json.dumps(
+            _finite(obj), separators=(",", ":"), default=_default, allow_nan=False
+        )
+    return s.encode()
+
+
+try:
+    import orjson
+
+    def loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # orjson rejects non-string keys and integers outside the 64-bit
+            # range, which json encodes; values that neither accepts raise
+            # TypeError from json as well.
+            return _stdlib_dumps(obj)
+
+except ImportError:
+
+    def loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return _stdlib_dumps(obj)
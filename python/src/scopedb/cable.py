@@ -1,46 +1,145 @@
 import asyncio
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from .errors import ScopeDBError
 
 if TYPE_CHECKING:
     from .client import Client
 
+# Queued by flush() to make the worker send its partial batch right away.
+_FLUSH = object()
+
 
 class RawCable:
     """
     A cable for ingesting raw data (dictionaries) into a ScopeDB table.
+
+    Appended rows are put on a bounded queue drained by a background worker,
+    which sends a batch once it reaches the batch size or has lingered for
+    ``linger`` seconds. Producers only wait when the queue is full.
+
+    When a batch fails to send, its rows are kept and the failure is raised
+    by the next ``append`` or ``flush``; every failure since the last report
+    is included. Kept rows are sent again by the next ``flush``.
+
+    Closing the client closes its cables, which sends their remaining rows.
     """
 
-    def __init__(self, client: "Client", table: str, batch_size: int = 1000):
+    def __init__(
+        self,
+        client: "Client",
+        table: str,
+        batch_size: int = 1000,
+        linger: float = 0.1,
+    ):
         self._client = client
         self._table = table
         self._batch_size = batch_size
-        self._buffer: List[Dict[str, Any]] = []
-        self._lock = asyncio.Lock()
+        self._linger = linger
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=batch_size * 4)
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._failed_rows: List[Dict[str, Any]] = []
+        self._errors: List[Exception] = []
+        client._cables.add(self)
 
     async def append(self, row: Dict[str, Any]) -> None:
         """
         Append a row to the buffer. Auto-flushes if batch size is reached.
         """
-        async with self._lock:
-            self._buffer.append(row)
-            if len(self._buffer) >= self._batch_size:
-                await self._flush_unsafe()
+        self._raise_errors()
+        self._ensure_worker()
+        await self._queue.put(row)
 
     async def flush(self) -> None:
         """
         Flush any remaining rows in the buffer.
+
+        Rows kept from failed batches are sent again. Rows appended while the
+        flush is in progress are sent before it returns.
         """
-        async with self._lock:
-            if self._buffer:
-                await self._flush_unsafe()
+        self._ensure_worker()
+        failed, self._failed_rows = self._failed_rows, []
+        for row in failed:
+            await self._queue.put(row)
+        await self._queue.put(_FLUSH)
+        await self._queue.join()
+        self._raise_errors()
 
-    async def _flush_unsafe(self) -> None:
+    async def close(self) -> None:
+        """
+        Flush the cable and stop its background worker.
+        """
         try:
-            # Assuming client has a generic ingest method
-            await self._client._ingest_batch(self._table, self._buffer)
-            self._buffer = []
+            await self.flush()
+        finally:
+            if self._worker is not None:
+                self._worker.cancel()
+                self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[Dict[str, Any]] = []
+        deadline: Optional[float] = None
+
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        item = await self._queue.get()
+                except TimeoutError:
+                    # Linger expired: send the partial batch.
+                    pending, batch, deadline = batch, [], None
+                    await self._send(pending)
+                    continue
+
+                if item is _FLUSH:
+                    if batch:
+                        pending, batch, deadline = batch, [], None
+                        await self._send(pending)
+                    self._queue.task_done()
+                    continue
+
+                if not batch:
+                    deadline = loop.time() + self._linger
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    pending, batch, deadline = batch, [], None
+                    await self._send(pending)
+        except asyncio.CancelledError:
+            # Keep rows collected but not sent yet for the next flush.
+            self._failed_rows.extend(batch)
+            for _ in batch:
+                self._queue.task_done()
+            raise
+
+    async def _send(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            await self._client._ingest_batch(self._table, batch)
+        except asyncio.CancelledError:
+            self._failed_rows.extend(batch)
+            raise
         except Exception as e:
-            raise ScopeDBError(
-                f"Failed to flush cable for table {self._table}: {e}"
-            ) from e
+            self._failed_rows.extend(batch)
+            self._errors.append(e)
+        finally:
+            # Rows count as processed once sent or kept for retry, so that
+            # flush() can wait on the queue with join().
+            for _ in batch:
+                self._queue.task_done()
+
+    def _raise_errors(self) -> None:
+        if not self._errors:
+            return
+
+        errors, self._errors = self._errors, []
+        details = "; ".join(str(e) for e in errors)
+        error = ScopeDBError(
+            f"Failed to flush cable for table {self._table}: "
+            f"{len(errors)} batch(es) failed, {len(self._failed_rows)} rows "
+            f"kept for the next flush: {details}"
+        )
+        error.__cause__ = errors[-1]
+        raise error
@@ -1,11 +1,81 @@
+import asyncio
+import weakref
 import httpx
-from typing import Optional, Any, List, Dict
+import msgspec
+from typing import Optional, Any, AsyncIterator, List, Dict, Sequence, Tuple
 from uuid import UUID
 
+from . import _json
 from .errors import ConnectionError, QueryError, ScopeDBError
 from .cable import RawCable
+from .result import ResultSet
 from .statement import Statement, StatementHandle
-from .models import ResultFormat
+from .models import ResultFormat, StatementResponse
+
+# Statement polling and ingestion issue many sequential requests to the same
+# host, so keep connections alive to avoid a TCP/TLS handshake per request.
+# max_connections also caps the concurrent requests of execute_many over
+# HTTP/1.1; over HTTP/2 they are multiplexed on a single connection.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0,
+)
+
+# Request bodies are encoded by hand (see _json), so set the content type.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Size at which a streamed ingest body is handed to the transport.
+INGEST_CHUNK_SIZE = 64 * 1024
+
+
+async def _ingest_body(
+    table: str, rows: List[Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Streams the ingest payload ``{"table": ..., "data": [...]}`` in chunks,
+    encoding rows as the body is sent rather than all up front.
+    """
+    chunk = bytearray(b'{"table":')
+    chunk += _json.dumps(table)
+    chunk += b',"data":['
+    for i, row in enumerate(rows):
+        if i:
+            chunk += b","
+        chunk += _json.dumps(row)
+        if len(chunk) >= INGEST_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"]}"
+    yield bytes(chunk)
+
+
+def _decode_statement_response(
+    resp: httpx.Response, action: str
+) -> StatementResponse:
+    try:
+        return msgspec.json.decode(resp.content, type=StatementResponse)
+    except msgspec.DecodeError as e:
+        # Also covers msgspec.ValidationError, a DecodeError subclass.
+        raise ScopeDBError(f"{action} returned an invalid response: {e}") from e
+
+
+async def _cancel_submissions(
+    submissions: List[asyncio.Task[StatementHandle]],
+) -> None:
+    """
+    Cancels the submitted statements on the server, waiting for submissions
+    still in flight. Terminated statements and failed submissions are skipped.
+    """
+
+    async def cancel(submission: asyncio.Task[StatementHandle]) -> None:
+        try:
+            handle = await submission
+        except Exception:
+            return
+        await handle.cancel()
+
+    await asyncio.gather(*(cancel(s) for s in submissions), return_exceptions=True)
 
 
 class Client:
@@ -13,38 +83,82 @@ class Client:
     ScopeDB Client for Python.
     """
 
-    def __init__(self, dsn: str, token: Optional[str] = None):
+    def __init__(
+        self,
+        dsn: str,
+        token: Optional[str] = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
         self.base_url = dsn.rstrip("/")
         self.token = token
-        self._client: Optional[httpx.AsyncClient] = None
+        self.limits = limits
+        # Closed with the Client, so that no worker sends rows afterwards.
+        self._cables: weakref.WeakSet[RawCable] = weakref.WeakSet()
+        # httpx opens no connection until the first request, so the client
+        # is built up front and every method can use it without a check.
+        self._client = self._build_client()
 
-    async def connect(self) -> None:
-        """
-        Initialize the HTTP client.
-        """
+    def _build_client(self) -> httpx.AsyncClient:
         headers = {}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url, headers=headers, timeout=30.0
+        # HTTP/2 multiplexes concurrent requests over a single connection.
+        # No custom transport is passed, so that httpx still applies the
+        # HTTP(S)_PROXY and NO_PROXY environment variables.
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=30.0,
+            http2=True,
+            limits=self.limits,
         )
-        # Optional: Ping server to verify connection
+
+    async def connect(self) -> None:
+        """
+        Reopen the HTTP client if it was closed.
+
+        The HTTP client is created with the Client and connects lazily on the
+        first request, so calling this is optional. Use ``ping`` to verify
+        that the server is reachable.
+        """
+        self._ensure_open()
+
+    def _ensure_open(self) -> None:
+        # Like the lazy connect it replaced, using a closed Client reopens it.
+        if self._client.is_closed:
+            self._client = self._build_client()
+
+    async def ping(self) -> bool:
+        """
+        Check whether the server is reachable and healthy.
+        """
+        self._ensure_open()
         try:
             resp = await self._client.get("/health")
             resp.raise_for_status()
         except httpx.HTTPError:
-            # We don't raise here strictly, but it's good practice.
-            # For a basic SDK, we might just log or ignore if lazy connect.
-            pass
+            return False
+        return True
 
     async def close(self) -> None:
         """
-        Close the HTTP client.
+        Close the cables of the Client, sending their remaining rows, and the
+        HTTP client. Using the Client afterwards reopens it.
+
+        If a cable fails to send its rows, the others are still closed and
+        the first failure is raised.
         """
-        if self._client:
+        cables, self._cables = list(self._cables), weakref.WeakSet()
+        try:
+            results = await asyncio.gather(
+                *(c.close() for c in cables), return_exceptions=True
+            )
+        finally:
             await self._client.aclose()
-            self._client = None
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     def statement(self, stmt: str) -> Statement:
         """
@@ -52,101 +166,147 @@ class Client:
         """
         return Statement(self, stmt)
 
-    async def submit_statement_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_many(self, stmts: Sequence[str]) -> List[ResultSet]:
         """
-        Internal method to submit a statement request.
+        Execute statements concurrently and return their result sets in order.
+
+        The requests share the client's connection pool, so over HTTP/2 they
+        are multiplexed on one connection.
+
+        If a statement fails, the others are cancelled, both locally and on
+        the server, and the first failure is raised. The statements are also
+        cancelled on the server if execute_many itself is cancelled.
         """
-        if not self._client:
-            await self.connect()
-        assert self._client is not None
+        submissions: List[asyncio.Task[StatementHandle]] = []
+
+        async def execute(stmt: str) -> ResultSet:
+            # The submission is shielded so that a statement which reaches
+            # the server always yields a handle to cancel it with.
+            submission = asyncio.create_task(self.statement(stmt).submit())
+            submissions.append(submission)
+            handle = await asyncio.shield(submission)
+            return await handle.fetch()
 
         try:
-            resp = await self._client.post("/v1/statements", json=payload)
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPStatusError as e:
-            raise QueryError(f"Statement submission failed: {e.response.text}") from e
-        except httpx.HTTPError as e:
-            raise ConnectionError(f"Network error during statement submission: {e}") from e
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(execute(s)) for s in stmts]
+        except BaseException as e:
+            # Cancelling the tasks only stops polling; the statements would
+            # keep running on the server. Shielded so that a second
+            # cancellation does not interrupt the cleanup.
+            await asyncio.shield(_cancel_submissions(submissions))
+            if isinstance(e, BaseExceptionGroup):
+                raise e.exceptions[0]
+            raise
 
-    async def fetch_statement_result(self, statement_id: UUID, format: ResultFormat) -> Dict[str, Any]:
-        """
-        Internal method to fetch statement results.
+        return [t.result() for t in tasks]
+
+    async def _request(
+        self, method: str, path: str, action: str, **kwargs: Any
+    ) -> httpx.Response:
         """
-        if not self._client:
-            await self.connect()
-        assert self._client is not None
+        Internal method to send a request, translating HTTP errors.
 
+        Error statuses raise QueryError and network failures raise
+        ConnectionError, both prefixed with ``action``.
+        """
+        self._ensure_open()
         try:
-            resp = await self._client.get(
-                f"/v1/statements/{statement_id}",
-                params={"format": format.value}
-            )
-            resp.raise_for_status()
-            return resp.json()
+            resp = await self._client.request(method, path, **kwargs)
+            # 304 answers a conditional request; the caller handles it.
+            if resp.status_code != httpx.codes.NOT_MODIFIED:
+                resp.raise_for_status()
+            return resp
         except httpx.HTTPStatusError as e:
-            raise QueryError(f"Fetch statement result failed: {e.response.text}") from e
+            raise QueryError(f"{action} failed: {e.response.text}") from e
         except httpx.HTTPError as e:
-            raise ConnectionError(f"Network error during fetch statement result: {e}") from e
+            raise ConnectionError(f"Network error during {action.lower()}: {e}") from e
+
+    async def submit_statement_request(
+        self, payload: Dict[str, Any]
+    ) -> StatementResponse:
+        """
+        Internal method to submit a statement request.
+        """
+        resp = await self._request(
+            "POST",
+            "/v1/statements",
+            "Statement submission",
+            content=_json.dumps(payload),
+            headers=JSON_HEADERS,
+        )
+        return _decode_statement_response(resp, "Statement submission")
+
+    async def fetch_statement_result(
+        self,
+        statement_id: UUID,
+        format: ResultFormat,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[StatementResponse], Optional[str]]:
+        """
+        Internal method to fetch statement results.
+
+        Returns the response body and its ETag. If ``etag`` is given and the
+        server reports the statement unchanged (304), the body is None.
+        """
+        resp = await self._request(
+            "GET",
+            f"/v1/statements/{statement_id}",
+            "Fetch statement result",
+            params={"format": format.value},
+            headers={"If-None-Match": etag} if etag else None,
+        )
+        if resp.status_code == httpx.codes.NOT_MODIFIED:
+            return None, etag
+        body = _decode_statement_response(resp, "Fetch statement result")
+        return body, resp.headers.get("ETag")
 
     async def cancel_statement(self, statement_id: UUID) -> Dict[str, Any]:
         """
         Internal method to cancel a statement.
         """
-        if not self._client:
-            await self.connect()
-        assert self._client is not None
-
-        try:
-            # Empty body POST
-            resp = await self._client.post(f"/v1/statements/{statement_id}/cancel", content=b"")
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPStatusError as e:
-            raise QueryError(f"Cancel statement failed: {e.response.text}") from e
-        except httpx.HTTPError as e:
-            raise ConnectionError(f"Network error during cancel statement: {e}") from e
+        # Empty body POST
+        resp = await self._request(
+            "POST",
+            f"/v1/statements/{statement_id}/cancel",
+            "Cancel statement",
+            content=b"",
+        )
+        return _json.loads(resp.content)
 
     async def query(self, sql: str) -> Dict[str, Any]:
         """
         Execute a SQL query.
         """
-        if not self._client:
-            await self.connect()
-
-        assert self._client is not None
-
-        try:
-            resp = await self._client.post("/v1/query", json={"query": sql})
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPStatusError as e:
-            raise QueryError(f"Query failed: {e.response.text}") from e
-        except httpx.HTTPError as e:
-            raise ConnectionError(f"Network error during query: {e}") from e
+        resp = await self._request(
+            "POST",
+            "/v1/query",
+            "Query",
+            content=_json.dumps({"query": sql}),
+            headers=JSON_HEADERS,
+        )
+        return _json.loads(resp.content)
 
-    def create_raw_cable(self, table: str, batch_size: int = 1000) -> RawCable:
+    def create_raw_cable(
+        self, table: str, batch_size: int = 1000, linger: float = 0.1
+    ) -> RawCable:
         """
         Create a cable for ingesting raw data.
         """
-        return RawCable(self, table, batch_size)
+        return RawCable(self, table, batch_size, linger)
 
     async def _ingest_batch(self, table: str, rows: List[Dict[str, Any]]) -> None:
         """
         Internal method to send a batch of rows.
         """
-        if not self._client:
-            await self.connect()
-
-        assert self._client is not None
-
-        try:
-            # Payload structure is a guess based on typical batch APIs
-            payload = {"table": table, "data": rows}
-            resp = await self._client.post("/v1/ingest", json=payload)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
-            raise ConnectionError(f"Ingest failed: {e}") from e
+        # Payload structure is a guess based on typical batch APIs
+        await self._request(
+            "POST",
+            "/v1/ingest",
+            "Ingest",
+            content=_ingest_body(table, rows),
+            headers=JSON_HEADERS,
+        )
 
     async def __aenter__(self) -> "Client":
         await self.connect()
@@ -0,0 +1,20 @@
+import asyncio
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a uvloop event loop if uvloop is available, or a default one.
+
+    Pass it as the loop factory when starting the event loop::
+
+        asyncio.run(main(), loop_factory=scopedb.new_event_loop)
+
+    uvloop is not available on Windows or when the ``uvloop`` extra is not
+    installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+
+    return uvloop.new_event_loop()
@@ -1,6 +1,8 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
+from uuid import UUID
+
+import msgspec
 
 class ResultFormat(str, Enum):
     JSON = "json"
@@ -16,11 +18,26 @@ class StatementStatus(str, Enum):
         return self == StatementStatus.FINISHED
 
     def is_terminated(self) -> bool:
-        return self in (
-            StatementStatus.FINISHED,
-            StatementStatus.FAILED,
-            StatementStatus.CANCELLED,
-        )
+        return self in _TERMINAL_STATUSES
+
+    @classmethod
+    def parse(cls, s: str) -> "StatementStatus":
+        """
+        Same as StatementStatus(s), but a plain dict lookup.
+        """
+        try:
+            return _STATUS_MAP[s]
+        except KeyError:
+            raise ValueError(f"{s!r} is not a valid StatementStatus") from None
+
+_TERMINAL_STATUSES = frozenset(
+    {
+        StatementStatus.FINISHED,
+        StatementStatus.FAILED,
+        StatementStatus.CANCELLED,
+    }
+)
+_STATUS_MAP = {m.value: m for m in StatementStatus}
 
 class DataType(str, Enum):
     STRING = "string"
@@ -34,28 +51,41 @@ class DataType(str, Enum):
     OBJECT = "object"
     ANY = "any"
 
-@dataclass
-class StatementProgress:
-    total_percentage: float
-    nanos_from_submitted: int
-    nanos_from_started: int
-    total_stages: int
-    total_partitions: int
-    total_rows: int
-    total_compressed_bytes: int
-    total_uncompressed_bytes: int
-    scanned_stages: int
-    scanned_partitions: int
-    scanned_rows: int
-    scanned_compressed_bytes: int
-    scanned_uncompressed_bytes: int
-
-@dataclass
-class FieldSchema:
+class StatementProgress(msgspec.Struct):
+    total_percentage: float = 0.0
+    nanos_from_submitted: int = 0
+    nanos_from_started: int = 0
+    total_stages: int = 0
+    total_partitions: int = 0
+    total_rows: int = 0
+    total_compressed_bytes: int = 0
+    total_uncompressed_bytes: int = 0
+    scanned_stages: int = 0
+    scanned_partitions: int = 0
+    scanned_rows: int = 0
+    scanned_compressed_bytes: int = 0
+    scanned_uncompressed_bytes: int = 0
+
+# Finished statements report "progress": {}, which decodes to all defaults.
+EMPTY_PROGRESS = StatementProgress()
+
+class FieldSchema(msgspec.Struct):
     name: str
     type: DataType
 
-@dataclass
-class ResultSetMetadata:
+class ResultSetMetadata(msgspec.Struct):
     fields: list[FieldSchema]
     num_rows: int
+
+class StatementResponse(msgspec.Struct):
+    """
+    A statement response, decoded from JSON in one pass by msgspec.
+
+    The result set stays a plain dict: its field schema is parsed by
+    StatementHandle, which accepts several spellings of the data type key.
+    """
+    statement_id: UUID
+    status: Optional[StatementStatus] = None
+    message: Optional[str] = None
+    progress: Optional[StatementProgress] = None
+    result_set: Optional[dict[str, Any]] = None
@@ -1,8 +1,68 @@
 import json
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from datetime import datetime, timedelta
 from .models import DataType, FieldSchema, ResultFormat, ResultSetMetadata
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd  # type: ignore[import-untyped]
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+# The server encodes every value as a string or null in the JSON rows (the Go
+# SDK unmarshals them into [][]*string), so each column gets one converter
+# from its string representation, chosen once per result set.
+_Converter = Callable[[Optional[str]], Any]
+
+
+def _identity(v: Optional[str]) -> Any:
+    return v
+
+
+def _nullable(conv: Callable[[str], Any]) -> _Converter:
+    def convert(v: Optional[str]) -> Any:
+        return None if v is None else conv(v)
+
+    return convert
+
+
+def _parse_bool(v: str) -> bool:
+    return v.lower() == "true"
+
+
+def _fromisoformat(v: str) -> datetime:
+    return datetime.fromisoformat(v.replace('Z', '+00:00'))
+
+
+_parse_ts: Callable[[str], datetime]
+try:
+    # C implementation that parses RFC 3339 (including "Z") directly.
+    from ciso8601 import parse_datetime
+
+    _parse_ts = parse_datetime
+except ImportError:
+    _parse_ts = _fromisoformat
+
+
+def _parse_timestamp(v: str) -> Any:
+    # RFC3339Nano
+    try:
+        return _parse_ts(v)
+    except ValueError:
+        return v  # Return as string if parse fails
+
+
+# INTERVAL (a Go duration string such as "1h2m"), ARRAY, OBJECT and ANY are
+# returned as strings, as are unknown types.
+_CONVERTERS: Dict[DataType, _Converter] = {
+    DataType.STRING: _identity,
+    DataType.INT: _nullable(int),
+    DataType.UINT: _nullable(int),  # Python ints are arbitrary precision
+    DataType.FLOAT: _nullable(float),
+    DataType.BOOLEAN: _nullable(_parse_bool),
+    DataType.TIMESTAMP: _nullable(_parse_timestamp),
+}
+
+
 class ResultSet:
     """
     Stores the result of a statement execution.
@@ -36,59 +96,95 @@ class ResultSet:
         if self.format != ResultFormat.JSON:
             raise ValueError(f"Unexpected result set format: {self.format}")
 
-        # rows_raw should be List[List[Optional[str]]] based on Go implementation logic
-        # but since we receive parsed JSON from httpx, it might be List[List[Optional[str]]] already.
-        # The Go code does json.Unmarshal(rs.Rows, &rows) where rows is [][]*string.
+        schema = self.schema
+        if any(len(row) != len(schema) for row in self._rows_raw):
+            raise ValueError("Schema length does not match record length")
 
-        parsed_data = []
-        for row in self._rows_raw:
-            if len(row) != len(self.schema):
-                raise ValueError("Schema length does not match record length")
-
-            parsed_row = []
-            for i, val_str in enumerate(row):
-                field_type = self.schema[i].type
-                parsed_row.append(self._convert_value(val_str, field_type))
-            parsed_data.append(parsed_row)
+        converters = [_CONVERTERS.get(f.type, _identity) for f in schema]
+        parsed_data = [
+            [conv(v) for conv, v in zip(converters, row)] for row in self._rows_raw
+        ]
 
         self._parsed_rows = parsed_data
         return parsed_data
 
-    def _convert_value(self, v: Optional[str], typ: DataType) -> Any:
-        if v is None:
-            return None
-
-        if typ == DataType.STRING:
-            return v
-        elif typ == DataType.INT:
-            return int(v)
-        elif typ == DataType.UINT:
-            return int(v)  # Python ints are arbitrary precision
-        elif typ == DataType.FLOAT:
-            return float(v)
-        elif typ == DataType.BOOLEAN:
-            # Go's strconv.ParseBool handles 1, t, T, TRUE, true, True, etc.
-            # Assuming standard JSON bool or string "true"/"false" from server.
-            # If server sends actual boolean in JSON, v is bool. If server sends string representation, v is str.
-            # Go SDK expects *string in Unmarshal, so likely server sends strings for everything in JSON lines format?
-            # Wait, Go struct definition: Rows json.RawMessage `json:"rows"`.
-            # And `var rows [][]*string`.
-            # So yes, everything is a string or null in the JSON array.
-            return v.lower() == "true"
-        elif typ == DataType.TIMESTAMP:
-            # RFC3339Nano
-            try:
-                # Python 3.11+ has fromisoformat support for Z, but standard lib might need help for older versions or nano.
-                # Simplest is fromisoformat if format is standard.
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
-            except ValueError:
-                return v # Return as string if parse fails
-        elif typ == DataType.INTERVAL:
-            # Go duration string (e.g., "1h2m"). Python doesn't parse this natively easily.
-            # For now, return as string or implementing a simple parser if critical.
-            # Keeping as string for parity with "hard to parse" types unless we add a library.
-            return v
-        elif typ in (DataType.ARRAY, DataType.OBJECT, DataType.ANY):
-            return v
-
-        return v
+    def to_arrow(self) -> "pa.Table":
+        """
+        Reads the result set into a pyarrow Table.
+
+        Each column is parsed from its string representation by Arrow's compute
+        kernels rather than per cell in Python. Requires the ``arrow`` extra.
+
+        Conversions follow ``to_values``: booleans are true only for "true" in
+        any case, and invalid numbers raise ValueError. Timestamps become
+        ``timestamp[ns, UTC]``; if any value in a timestamp column cannot be
+        parsed or falls outside that type's range (years 1677-2262), the whole
+        column is kept as strings.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc  # type: ignore[import-untyped]
+        except ImportError as e:
+            raise ImportError(
+                "to_arrow requires pyarrow; install scopedb-sdk[arrow]"
+            ) from e
+
+        if self.format != ResultFormat.JSON:
+            raise ValueError(f"Unexpected result set format: {self.format}")
+
+        schema = self.schema
+        if any(len(row) != len(schema) for row in self._rows_raw):
+            raise ValueError("Schema length does not match record length")
+
+        numeric_types = {
+            DataType.INT: pa.int64(),
+            DataType.UINT: pa.uint64(),
+            DataType.FLOAT: pa.float64(),
+        }
+        columns = list(zip(*self._rows_raw)) or [()] * len(schema)
+        arrays = []
+        for field, column in zip(schema, columns):
+            array = pa.array(column, type=pa.string())
+            if field.type in numeric_types:
+                array = array.cast(numeric_types[field.type])
+            elif field.type == DataType.BOOLEAN:
+                array = pc.equal(pc.utf8_lower(array), "true")
+            elif field.type == DataType.TIMESTAMP:
+                try:
+                    array = array.cast(pa.timestamp("ns", tz="UTC"))
+                except pa.ArrowInvalid:
+                    pass  # Keep as strings, like to_values does per value
+            arrays.append(array)
+
+        return pa.Table.from_arrays(arrays, names=[f.name for f in schema])
+
+    def to_arrays(self) -> Dict[str, "np.ndarray"]:
+        """
+        Reads the result set into a dict of column name to numpy array.
+
+        Columns are parsed by ``to_arrow`` (see there for how values that do
+        not parse are handled) and converted column-wise. Numeric
+        columns without nulls become int64/uint64/float64 arrays; columns with
+        nulls follow Arrow's conversion (e.g. float64 with NaN), and strings
+        become object arrays. The result can be passed to
+        ``pd.DataFrame(arrays, copy=False)``.
+        """
+        table = self.to_arrow()
+        return {
+            name: column.to_numpy()
+            for name, column in zip(table.column_names, table.columns)
+        }
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Reads the result set into a pandas DataFrame via ``to_arrow``.
+        Requires the ``pandas`` extra.
+        """
+        try:
+            import pandas  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "to_pandas requires pandas; install scopedb-sdk[pandas]"
+            ) from e
+
+        return self.to_arrow().to_pandas()
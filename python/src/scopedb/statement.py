@@ -1,11 +1,12 @@
 import asyncio
-import time
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from uuid import UUID
 
 from .models import (
     StatementStatus,
     StatementProgress,
+    StatementResponse,
+    EMPTY_PROGRESS,
     ResultFormat,
     ResultSetMetadata,
     FieldSchema,
@@ -17,6 +18,26 @@ from .errors import ScopeDBError
 if TYPE_CHECKING:
     from .client import Client
 
+# Bounds of the delay between two polls in StatementHandle.fetch.
+_MIN_TICK = 0.0005  # 500us
+_MAX_TICK = 1.0  # 1s
+
+# Handle potential casing variations in API response
+_DATATYPE_KEYS = ("data_type", "data_Type", "dataType")
+_DATATYPES = {m.value: m for m in DataType}
+
+
+def _parse_metadata(meta_data: dict[str, Any]) -> ResultSetMetadata:
+    fields = []
+    for f in meta_data.get("fields", []):
+        name = f.get("name")
+        dtype_str = next((f[k] for k in _DATATYPE_KEYS if f.get(k)), None)
+        if name and dtype_str:
+            dtype = _DATATYPES.get(dtype_str) or DataType(dtype_str)
+            fields.append(FieldSchema(name, dtype))
+
+    return ResultSetMetadata(fields=fields, num_rows=meta_data.get("num_rows", 0))
+
 
 class StatementHandle:
     """
@@ -28,48 +49,44 @@ class StatementHandle:
         client: "Client",
         statement_id: UUID,
         format: ResultFormat = ResultFormat.JSON,
-        initial_response: Optional[dict] = None,
+        initial_response: Optional[StatementResponse] = None,
     ):
         self._client = client
         self.id = statement_id
         self.format = format
         self._last_response = initial_response
+        self._etag: Optional[str] = None
+        self._metadata_source: Optional[dict[str, Any]] = None
+        self._cached_metadata: Optional[ResultSetMetadata] = None
 
     @property
     def status(self) -> Optional[StatementStatus]:
         if not self._last_response:
             return None
-        status_str = self._last_response.get("status")
-        return StatementStatus(status_str) if status_str else None
+        return self._last_response.status
 
     @property
     def progress(self) -> Optional[StatementProgress]:
         if not self._last_response:
             return None
-        prog_data = self._last_response.get("progress")
-        if not prog_data:
+        progress = self._last_response.progress
+        if progress is None or progress == EMPTY_PROGRESS:
             return None
-        return StatementProgress(**prog_data)
+        return progress
 
     def result_set(self) -> Optional[ResultSet]:
         if not self._last_response:
             return None
 
-        rs_data = self._last_response.get("result_set")
+        rs_data = self._last_response.result_set
         if not rs_data:
             return None
 
         meta_data = rs_data.get("metadata", {})
-        fields_data = meta_data.get("fields", [])
-        fields = []
-        for f in fields_data:
-            name = f.get("name")
-            # Handle potential casing variations in API response
-            dtype_str = f.get("data_Type") or f.get("data_type") or f.get("dataType")
-            if name and dtype_str:
-                fields.append(FieldSchema(name, DataType(dtype_str)))
-
-        metadata = ResultSetMetadata(fields=fields, num_rows=meta_data.get("num_rows", 0))
+        if self._cached_metadata is None or meta_data is not self._metadata_source:
+            self._cached_metadata = _parse_metadata(meta_data)
+            self._metadata_source = meta_data
+        metadata = self._cached_metadata
 
         return ResultSet(
             metadata=metadata,
@@ -84,10 +101,15 @@ class StatementHandle:
         if self.status and self.status.is_terminated():
             return
 
-        resp = await self._client.fetch_statement_result(self.id, self.format)
+        resp, self._etag = await self._client.fetch_statement_result(
+            self.id, self.format, self._etag
+        )
+        if resp is None:
+            # Not modified since the last fetch; keep the last response.
+            return
         self._last_response = resp
 
-        msg = resp.get("message")
+        msg = resp.message
         if msg:
             # In Go: if resp.Message != nil { return &Error{Message: *resp.Message} }
             # Here we might raise or just let the user check status.
@@ -98,8 +120,9 @@ class StatementHandle:
         """
         Fetches the result set of the statement until it is finished, failed or cancelled.
         """
-        tick = 0.005  # 5ms
-        max_tick = 1.0  # 1s
+        backoff = 0.005  # 5ms
+        polled = False
+        last_percentage: Optional[float] = None
 
         while True:
             # Check if we already have a result or error in the last response
@@ -108,7 +131,7 @@ class StatementHandle:
                 if rs:
                     return rs
 
-                msg = self._last_response.get("message")
+                msg = self._last_response.message
                 if msg:
                     raise ScopeDBError(f"Statement failed: {msg}")
 
@@ -116,11 +139,41 @@ class StatementHandle:
                 if self.status and self.status.is_terminated():
                      raise ScopeDBError(f"Statement terminated with status: {self.status}")
 
-            await asyncio.sleep(tick)
-            if tick < max_tick:
-                tick = min(tick * 2, max_tick)
+            # Poll once right away; only sleep between subsequent polls.
+            if polled:
+                progress = self.progress
+                percentage = progress.total_percentage if progress else None
+                estimate = self._estimate_tick()
+                if estimate is not None and percentage != last_percentage:
+                    tick = estimate
+                else:
+                    # No estimate, or the progress has not advanced since the
+                    # last poll (a slow stage, or a 304 with stale progress):
+                    # keep backing off so a stalled estimate cannot spin.
+                    tick = max(estimate or 0.0, backoff)
+                    backoff = min(backoff * 2, _MAX_TICK)
+                last_percentage = percentage
+                await asyncio.sleep(tick)
 
             await self.fetch_once()
+            polled = True
+
+    def _estimate_tick(self) -> Optional[float]:
+        """
+        Estimates the next poll delay from the last reported progress, or
+        returns None if the progress does not allow an estimate.
+        """
+        progress = self.progress
+        if not progress:
+            return None
+
+        pct = progress.total_percentage
+        if pct <= 0.0 or pct >= 100.0 or progress.nanos_from_started <= 0:
+            return None
+
+        elapsed = progress.nanos_from_started / 1e9
+        remaining = elapsed * (100.0 - pct) / pct
+        return max(_MIN_TICK, min(_MAX_TICK, remaining / 4))
 
     async def cancel(self) -> StatementStatus:
         """
@@ -134,7 +187,7 @@ class StatementHandle:
         # Update internal state with cancel response
         # The cancel response structure in Go: { Status, Message }
         # It doesn't give full statement response, but we should update our status.
-        new_status = StatementStatus(resp["status"])
+        new_status = StatementStatus.parse(resp["status"])
 
         # We need to mimic a statement response update or just update status manually?
         # Ideally we fetch once more or update local state partially.
@@ -142,9 +195,9 @@ class StatementHandle:
         # but simpler is just returning the status and letting next fetch handle full state.
         # However, Go updates h.resp.Status = resp.Status.
         if self._last_response:
-            self._last_response["status"] = new_status
+            self._last_response.status = new_status
             if "message" in resp:
-                self._last_response["message"] = resp["message"]
+                self._last_response.message = resp["message"]
 
         return new_status
 
@@ -178,7 +231,7 @@ class Statement:
 
         return StatementHandle(
             client=self._client,
-            statement_id=UUID(resp["statement_id"]),
+            statement_id=resp.statement_id,
             format=self.result_format,
             initial_response=resp
         )
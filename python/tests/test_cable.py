@@ -0,0 +1,115 @@
+import asyncio
+import json
+from typing import Any, List
+
+import httpx
+import pytest
+import respx
+
+from scopedb import Client, ScopeDBError
+
+BASE_URL = "http://scopedb.test"
+
+
+class _Ingest:
+    """
+    Mocks the ingest API, recording the rows of every batch. The first
+    ``failures`` requests fail.
+    """
+
+    def __init__(self, mock: respx.MockRouter, failures: int = 0):
+        self.batches: List[List[Any]] = []
+        self.failures = failures
+        mock.post("/v1/ingest").mock(side_effect=self.ingest)
+
+    def ingest(self, request: httpx.Request) -> httpx.Response:
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(500, text="unavailable")
+        self.batches.append(json.loads(request.content)["data"])
+        return httpx.Response(200, json={})
+
+    @property
+    def rows(self) -> List[Any]:
+        return [row for batch in self.batches for row in batch]
+
+
+@pytest.mark.asyncio
+async def test_sends_full_batches_without_flush() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        ingest = _Ingest(mock)
+        async with Client(BASE_URL) as client:
+            cable = client.create_raw_cable("t", batch_size=3, linger=60.0)
+            for i in range(6):
+                await cable.append({"i": i})
+            await asyncio.sleep(0.05)
+
+            assert [len(b) for b in ingest.batches] == [3, 3]
+            await cable.flush()
+            # Nothing was left over, so flush sends no empty batch.
+            assert [len(b) for b in ingest.batches] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_sends_partial_batch_after_linger() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        ingest = _Ingest(mock)
+        async with Client(BASE_URL) as client:
+            cable = client.create_raw_cable("t", batch_size=100, linger=0.05)
+            await cable.append({"i": 0})
+            await cable.append({"i": 1})
+            assert ingest.batches == []
+
+            await asyncio.sleep(0.2)
+            assert ingest.batches == [[{"i": 0}, {"i": 1}]]
+
+
+@pytest.mark.asyncio
+async def test_retries_failed_rows_on_next_flush() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        ingest = _Ingest(mock, failures=2)
+        async with Client(BASE_URL) as client:
+            cable = client.create_raw_cable("t", batch_size=2, linger=60.0)
+            for i in range(5):
+                await cable.append({"i": i})
+
+            with pytest.raises(ScopeDBError, match="2 batch"):
+                await cable.flush()
+            assert ingest.rows == [{"i": 4}]
+
+            await cable.flush()
+            assert sorted(r["i"] for r in ingest.rows) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_append_and_flush() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        ingest = _Ingest(mock)
+        async with Client(BASE_URL) as client:
+            cable = client.create_raw_cable("t", batch_size=7, linger=60.0)
+
+            async def produce(p: int) -> None:
+                for i in range(50):
+                    await cable.append({"p": p, "i": i})
+                    if i % 10 == 0:
+                        await cable.flush()
+
+            await asyncio.gather(*(produce(p) for p in range(4)))
+            await cable.flush()
+
+    rows = [(r["p"], r["i"]) for r in ingest.rows]
+    assert sorted(rows) == [(p, i) for p in range(4) for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_client_close_flushes_and_stops_cables() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        ingest = _Ingest(mock)
+        async with Client(BASE_URL) as client:
+            cable = client.create_raw_cable("t", batch_size=100, linger=0.05)
+            await cable.append({"i": 0})
+
+        assert ingest.rows == [{"i": 0}]
+        # No linger send after close reopens the HTTP client.
+        await asyncio.sleep(0.1)
+        assert client._client.is_closed
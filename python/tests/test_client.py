@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+import httpx
+import pytest
+import respx
+
+from scopedb import Client, ScopeDBError
+
+BASE_URL = "http://scopedb.test"
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between requests.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.client_address, self.path))  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[ThreadingHTTPServer]:
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    requests: List[Tuple[Any, str]] = []
+    server.requests = requests  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host!s}:{port}"
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_the_connection(server: ThreadingHTTPServer) -> None:
+    async with Client(_url(server)) as client:
+        for _ in range(3):
+            assert await client.ping()
+
+    requests = server.requests  # type: ignore[attr-defined]
+    assert len(requests) == 3
+    # Every request came from the same client socket.
+    assert len({addr for addr, _ in requests}) == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_honor_environment_proxies(
+    server: ThreadingHTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HTTP_PROXY", _url(server))
+
+    async with Client("http://scopedb.invalid") as client:
+        assert await client.ping()
+
+    # The proxy receives the absolute URL of the request.
+    requests = server.requests  # type: ignore[attr-defined]
+    assert [path for _, path in requests] == ["http://scopedb.invalid/health"]
+
+
+
+class _Statements:
+    """
+    Mocks the statement API. Statements run until cancelled, except "fail",
+    which fails right away, and "slow", whose submission takes 0.2s.
+    """
+
+    def __init__(self, mock: respx.MockRouter):
+        self.submitted: Dict[str, str] = {}
+        self.cancelled: List[str] = []
+        mock.post("/v1/statements").mock(side_effect=self.submit)
+        mock.get(path__regex=r"^/v1/statements/(?P<sid>[^/]+)$").mock(
+            side_effect=self.fetch
+        )
+        mock.post(path__regex=r"^/v1/statements/(?P<sid>[^/]+)/cancel$").mock(
+            side_effect=self.cancel
+        )
+
+    async def submit(self, request: httpx.Request) -> httpx.Response:
+        stmt = json.loads(request.content)["statement"]
+        if stmt == "slow":
+            await asyncio.sleep(0.2)
+        sid = str(uuid.uuid4())
+        self.submitted[stmt] = sid
+        if stmt == "fail":
+            body = {"statement_id": sid, "status": "failed", "message": "boom"}
+        else:
+            body = {"statement_id": sid, "status": "running"}
+        return httpx.Response(200, json=body)
+
+    def fetch(self, request: httpx.Request, sid: str) -> httpx.Response:
+        return httpx.Response(200, json={"statement_id": sid, "status": "running"})
+
+    def cancel(self, request: httpx.Request, sid: str) -> httpx.Response:
+        self.cancelled.append(sid)
+        return httpx.Response(200, json={"status": "cancelled"})
+
+
+@pytest.mark.asyncio
+async def test_execute_many_cancels_statements_when_one_fails() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        statements = _Statements(mock)
+        async with Client(BASE_URL) as client:
+            with pytest.raises(ScopeDBError, match="boom"):
+                await client.execute_many(["a", "slow", "fail"])
+
+    # "slow" was still being submitted when "fail" failed.
+    submitted = statements.submitted
+    assert sorted(statements.cancelled) == sorted([submitted["a"], submitted["slow"]])
+
+
+@pytest.mark.asyncio
+async def test_execute_many_cancels_statements_when_cancelled() -> None:
+    with respx.mock(base_url=BASE_URL) as mock:
+        statements = _Statements(mock)
+        async with Client(BASE_URL) as client:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(client.execute_many(["a", "b", "c"]), 0.1)
+
+    assert len(statements.submitted) == 3
+    assert sorted(statements.cancelled) == sorted(statements.submitted.values())
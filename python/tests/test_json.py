@@ -0,0 +1,55 @@
+import dataclasses
+import enum
+import json
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from scopedb import _json
+
+orjson = pytest.importorskip("orjson")
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    at: date
+
+
+VALUES = [
+    {"s": "é", "i": 1, "f": 1.5, "b": True, "n": None, "l": [1, (2, 3)]},
+    {"naive": datetime(2024, 1, 2, 3, 4, 5, 6)},
+    {"aware": datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=5, minutes=30)))},
+    {"utc": datetime(2024, 1, 2, tzinfo=timezone.utc)},
+    {"date": date(2024, 1, 2), "time": time(1, 2, 3, 4)},
+    {"uuid": uuid.UUID(int=1), "enum": Color.RED},
+    {"point": Point(1, date(2024, 1, 2))},
+    {1: "int key", 1.5: "float key", None: "none key"},
+    {"big": 2**64, "small": -(2**63) - 1},
+    {"nan": float("nan"), "inf": [float("inf"), float("-inf")]},
+    {"nested": {2: float("nan")}},
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_dumps_matches_with_and_without_orjson(value: Any) -> None:
+    assert json.loads(_json.dumps(value)) == json.loads(_json._stdlib_dumps(value))
+
+
+def test_dumps_encodes_nan_as_null() -> None:
+    assert _json._stdlib_dumps({"nan": float("nan")}) == b'{"nan":null}'
+    assert _json.dumps({"nan": float("nan")}) == b'{"nan":null}'
+
+
+@pytest.mark.parametrize("value", [{"set": {1}}, {"bytes": b"x"}, {(1, 2): 3}])
+def test_dumps_rejects_the_same_values(value: Any) -> None:
+    with pytest.raises(TypeError):
+        _json.dumps(value)
+    with pytest.raises(TypeError):
+        _json._stdlib_dumps(value)
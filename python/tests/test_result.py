@@ -0,0 +1,22 @@
+import pytest
+
+from scopedb import DataType, FieldSchema, ResultFormat, ResultSet, ResultSetMetadata
+
+
+def _result_set() -> ResultSet:
+    metadata = ResultSetMetadata(
+        fields=[FieldSchema("n", DataType.INT), FieldSchema("s", DataType.STRING)],
+        num_rows=2,
+    )
+    return ResultSet(metadata, ResultFormat.JSON, [["1", "a"], [None, "b"]])
+
+
+def test_to_pandas() -> None:
+    pytest.importorskip("pandas")
+
+    df = _result_set().to_pandas()
+
+    assert list(df.columns) == ["n", "s"]
+    assert df["n"].tolist()[0] == 1
+    assert df["n"].isna().tolist() == [False, True]
+    assert df["s"].tolist() == ["a", "b"]
@@ -0,0 +1,34 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from scopedb import Client
+
+BASE_URL = "http://scopedb.test"
+STATEMENT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.mark.asyncio
+async def test_fetch_backs_off_when_progress_stalls() -> None:
+    # A statement stuck at 95%, reported 5ms after it started.
+    running = {
+        "statement_id": STATEMENT_ID,
+        "status": "running",
+        "progress": {"total_percentage": 95.0, "nanos_from_started": 5_000_000},
+    }
+
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock.post("/v1/statements").respond(200, json=running)
+        route = mock.get(f"/v1/statements/{STATEMENT_ID}").respond(200, json=running)
+
+        async with Client(BASE_URL) as client:
+            handle = await client.statement("SELECT 1").submit()
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.5):
+                    await handle.fetch()
+
+    # Backing off from 5ms polls about 8 times in 0.5s; polling at the
+    # estimate's 500us floor would poll hundreds of times.
+    assert route.call_count < 20